@@ -8,27 +8,27 @@ interface ActionLogProps {
   currentMessage?: string;
 }
 
+// Status icons are static, so the elements are built once here instead of
+// re-evaluating three conditionals per row on every SSE-driven re-render.
+const STATUS_ICON: Record<ActionEvent["status"], React.ReactElement> = {
+  running: <Loader2 className="h-3 w-3 animate-spin text-primary" />,
+  done: <CheckCircle2 className="h-3 w-3 text-primary" />,
+  failed: <XCircle className="h-3 w-3 text-destructive" />,
+};
+
 export function ActionLog({ actions, busy, currentMessage }: ActionLogProps) {
   if (!busy && actions.length === 0) return null;
   return (
     <div className="space-y-1 rounded-md border border-border/40 bg-muted/30 px-3 py-2 text-xs">
       {actions.map((a) => (
         <div key={a.id} className="flex items-center gap-2 text-muted-foreground">
-          {a.status === "running" && (
-            <Loader2 className="h-3 w-3 animate-spin text-primary" />
-          )}
-          {a.status === "done" && (
-            <CheckCircle2 className="h-3 w-3 text-primary" />
-          )}
-          {a.status === "failed" && (
-            <XCircle className="h-3 w-3 text-destructive" />
-          )}
+          {STATUS_ICON[a.status]}
           <span className="truncate">{a.description}</span>
         </div>
       ))}
       {busy && currentMessage && (
         <div className="flex items-center gap-2 text-muted-foreground">
-          <Loader2 className="h-3 w-3 animate-spin text-primary" />
+          {STATUS_ICON.running}
           <span className="truncate">{currentMessage}</span>
         </div>
       )}
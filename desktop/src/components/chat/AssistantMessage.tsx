@@ -1,10 +1,11 @@
+import { memo, useCallback } from "react";
 import ReactMarkdown from "react-markdown";
 import remarkGfm from "remark-gfm";
 import remarkMath from "remark-math";
 import rehypeKatex from "rehype-katex";
 import "katex/dist/katex.min.css";
 
-import { ReferenceList } from "@/components/chat/ReferenceList";
+import { ReferenceList, type ReferenceItem } from "@/components/chat/ReferenceList";
 import { Sparkles } from "lucide-react";
 import type { RagAnswer } from "@/hooks/useRagAsk";
 
@@ -13,7 +14,39 @@ interface AssistantMessageProps {
   onJumpToPage?: (page: number) => void;
 }
 
-export function AssistantMessage({ answer, onJumpToPage }: AssistantMessageProps) {
+// Plugin lists are module constants so every message (and every re-render
+// while the chat streams) hands ReactMarkdown the same arrays instead of
+// fresh ones.
+const REMARK_PLUGINS = [remarkGfm, remarkMath];
+const REHYPE_PLUGINS = [rehypeKatex];
+
+// Anything that could make markdown/GFM/math render differently from the raw
+// text: inline syntax characters, block markers at line start (lists, quotes,
+// setext rules, indented code), trailing-space hard breaks and GFM autolink
+// triggers. Answers matching none of it skip the remark/rehype pipeline.
+const MARKDOWN_SYNTAX =
+  /[*_`#~|$\\<>[\]&@]|https?:|www\.|^\s*(?:[-+]|\d+[.)])\s|^\s*(?:-{3,}|={3,})\s*$|^(?: {4}|\t)| {2,}$/m;
+
+// One or more blank lines (LF or CRLF) separate paragraphs, as in markdown.
+const PARAGRAPH_BREAK = /\r?\n(?:[ \t]*\r?\n)+/;
+
+// Memoized: a finished answer never changes, but ChatPanel re-renders on every
+// SSE tick of the next question — re-parsing markdown and re-typesetting KaTeX
+// for the whole history each time is the dominant chat render cost.
+export const AssistantMessage = memo(function AssistantMessage({
+  answer,
+  onJumpToPage,
+}: AssistantMessageProps) {
+  // Items carry either a page (PDF) or a URL (web), so one handler serves
+  // every section.
+  const openReference = useCallback(
+    (item: ReferenceItem) => {
+      if (item.page) onJumpToPage?.(item.page);
+      else if (item.url) void openExternal(item.url);
+    },
+    [onJumpToPage],
+  );
+
   return (
     <div className="flex w-full max-w-[95%] gap-3 rounded-lg border-l-2 border-primary bg-card/50 p-4">
       <div className="mt-0.5 flex h-6 w-6 shrink-0 items-center justify-center rounded-full bg-primary/15">
@@ -21,44 +54,107 @@ export function AssistantMessage({ answer, onJumpToPage }: AssistantMessageProps
       </div>
       <div className="flex-1 space-y-3 overflow-hidden">
         <div className="prose prose-sm dark:prose-invert max-w-none break-words">
-          <ReactMarkdown
-            remarkPlugins={[remarkGfm, remarkMath]}
-            rehypePlugins={[rehypeKatex]}
-          >
-            {answer.answer}
-          </ReactMarkdown>
+          {MARKDOWN_SYNTAX.test(answer.answer) ? (
+            <ReactMarkdown
+              remarkPlugins={REMARK_PLUGINS}
+              rehypePlugins={REHYPE_PLUGINS}
+            >
+              {answer.answer}
+            </ReactMarkdown>
+          ) : (
+            // Same output ReactMarkdown would give: one <p> per blank-line
+            // separated block, with single newlines left in the text node
+            // where normal whitespace collapsing turns them into spaces.
+            answer.answer
+              .trim()
+              .split(PARAGRAPH_BREAK)
+              .filter(Boolean)
+              .map((para, i) => <p key={i}>{para}</p>)
+          )}
         </div>
-        {answer.pdf_sources && answer.pdf_sources.length > 0 && (
-          <ReferenceList
-            title={`PDF references (${answer.pdf_sources.length})`}
-            items={answer.pdf_sources.map((s, i) => ({
-              key: `pdf-${i}`,
-              label: `Page ${s.page ?? "?"}`,
-              detail: (s.text ?? "").slice(0, 180),
-              page: s.page,
-            }))}
-            onItemClick={(item) => item.page && onJumpToPage?.(item.page)}
-          />
-        )}
-        {answer.web_sources && answer.web_sources.length > 0 && (
-          <ReferenceList
-            title={`Web sources (${answer.web_sources.length})`}
-            items={answer.web_sources.map((s, i) => ({
-              key: `web-${i}`,
-              label: s.title || s.url || "Source",
-              detail: s.snippet ?? s.url ?? "",
-              url: s.url,
-            }))}
-            onItemClick={(item) => {
-              if (item.url) void openExternal(item.url);
-            }}
-          />
+        {REFERENCE_SECTIONS.map((renderSection) =>
+          renderSection(answer, openReference),
         )}
       </div>
     </div>
   );
+});
+
+type PdfSource = NonNullable<RagAnswer["pdf_sources"]>[number];
+type WebSource = NonNullable<RagAnswer["web_sources"]>[number];
+
+function pdfSourceItem(s: PdfSource, i: number): ReferenceItem {
+  return {
+    key: `pdf-${i}`,
+    label: `Page ${s.page ?? "?"}`,
+    detail: (s.text ?? "").slice(0, 180),
+    page: s.page,
+  };
 }
 
+function webSourceItem(s: WebSource, i: number): ReferenceItem {
+  return {
+    key: `web-${i}`,
+    label: s.title || s.url || "Source",
+    detail: s.snippet ?? s.url ?? "",
+    url: s.url,
+  };
+}
+
+// Property (not method) signatures, so `toItem` is checked contravariantly
+// against what `select` returns.
+interface ReferenceSection<T> {
+  key: string;
+  title: string;
+  select: (answer: RagAnswer) => T[] | undefined;
+  toItem: (source: T, index: number) => ReferenceItem;
+}
+
+type RenderReferenceSection = (
+  answer: RagAnswer,
+  onItemClick: (item: ReferenceItem) => void,
+) => React.ReactElement | null;
+
+// Binds one section's `select` and `toItem` to the same source type, then
+// erases it so sections of different kinds can share one table.
+function referenceSection<T>({
+  key,
+  title,
+  select,
+  toItem,
+}: ReferenceSection<T>): RenderReferenceSection {
+  return (answer, onItemClick) => {
+    const sources = select(answer);
+    if (!sources || sources.length === 0) return null;
+    return (
+      <ReferenceList
+        key={key}
+        title={`${title} (${sources.length})`}
+        sources={sources}
+        toItem={toItem}
+        onItemClick={onItemClick}
+      />
+    );
+  };
+}
+
+// Reference lists under an answer, in display order. Adding a source kind is
+// a new row here plus its item mapper.
+const REFERENCE_SECTIONS: RenderReferenceSection[] = [
+  referenceSection<PdfSource>({
+    key: "pdf",
+    title: "PDF references",
+    select: (a) => a.pdf_sources,
+    toItem: pdfSourceItem,
+  }),
+  referenceSection<WebSource>({
+    key: "web",
+    title: "Web sources",
+    select: (a) => a.web_sources,
+    toItem: webSourceItem,
+  }),
+];
+
 async function openExternal(url: string) {
   try {
     const { openUrl } = await import("@tauri-apps/plugin-opener");
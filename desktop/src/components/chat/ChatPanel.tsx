@@ -1,4 +1,4 @@
-import { useCallback, useEffect, useRef, useState } from "react";
+import { lazy, Suspense, useCallback, useEffect, useRef, useState } from "react";
 import { motion, AnimatePresence } from "motion/react";
 import { MessageSquare, Sparkles, Trash2, X } from "lucide-react";
 
@@ -6,7 +6,6 @@ import { Badge } from "@/components/ui/badge";
 import { Button } from "@/components/ui/button";
 import { Progress } from "@/components/ui/progress";
 import { ActionLog } from "@/components/chat/ActionLog";
-import { AssistantMessage } from "@/components/chat/AssistantMessage";
 import { ChatInput } from "@/components/chat/ChatInput";
 import { UserMessage } from "@/components/chat/UserMessage";
 import { useRagAsk, type RagAnswer } from "@/hooks/useRagAsk";
@@ -14,6 +13,14 @@ import { useRagIndex } from "@/hooks/useRagIndex";
 import { useUpdateConfig } from "@/hooks/useConfig";
 import { useAppStore } from "@/lib/store";
 
+// AssistantMessage pulls in react-markdown, remark/rehype and KaTeX (plus its
+// stylesheet) — by far the heaviest part of the chat bundle and only needed
+// once an answer arrives, so it's split out of the startup chunk.
+const loadAssistantMessage = () => import("@/components/chat/AssistantMessage");
+const AssistantMessage = lazy(() =>
+  loadAssistantMessage().then((m) => ({ default: m.AssistantMessage })),
+);
+
 interface ChatPanelProps {
   documentPath: string | null;
   onJumpToPage?: (page: number) => void;
@@ -29,6 +36,23 @@ interface ChatMessage {
 
 let messageCounter = 0;
 
+// Motion props are static; defining them once keeps every render (one per
+// SSE tick while an answer streams) from allocating fresh objects for each
+// message wrapper.
+const PANEL_MOTION = {
+  initial: { opacity: 0, x: 24 },
+  animate: { opacity: 1, x: 0 },
+  exit: { opacity: 0, x: 24 },
+  transition: { duration: 0.18 },
+};
+
+const MESSAGE_MOTION = {
+  initial: { opacity: 0, y: 8 },
+  animate: { opacity: 1, y: 0 },
+  exit: { opacity: 0 },
+  transition: { duration: 0.18 },
+};
+
 export function ChatPanel({
   documentPath,
   onJumpToPage,
@@ -58,6 +82,10 @@ export function ChatPanel({
       return;
     }
     void index.start(documentPath);
+    // Warm the markdown chunk while indexing runs so the first answer
+    // doesn't wait on it. A failed preload is harmless: React.lazy retries
+    // the import when the message first renders.
+    loadAssistantMessage().catch(() => {});
     setMessages([]);
     // eslint-disable-next-line react-hooks/exhaustive-deps
   }, [documentPath]);
@@ -112,10 +140,7 @@ export function ChatPanel({
         <motion.div
           key="chat-root"
           className="flex h-full w-full flex-col"
-          initial={{ opacity: 0, x: 24 }}
-          animate={{ opacity: 1, x: 0 }}
-          exit={{ opacity: 0, x: 24 }}
-          transition={{ duration: 0.18 }}
+          {...PANEL_MOTION}
         >
       <header className="flex shrink-0 items-center justify-between border-b border-border px-4 py-2">
         <div className="flex items-center gap-2">
@@ -169,17 +194,16 @@ export function ChatPanel({
             {messages.map((m) => (
               <motion.div
                 key={m.id}
-                initial={{ opacity: 0, y: 8 }}
-                animate={{ opacity: 1, y: 0 }}
-                exit={{ opacity: 0 }}
-                transition={{ duration: 0.18 }}
+                {...MESSAGE_MOTION}
               >
                 {m.kind === "user" && m.text && <UserMessage text={m.text} />}
                 {m.kind === "assistant" && m.answer && (
-                  <AssistantMessage
-                    answer={m.answer}
-                    onJumpToPage={onJumpToPage}
-                  />
+                  <Suspense fallback={null}>
+                    <AssistantMessage
+                      answer={m.answer}
+                      onJumpToPage={onJumpToPage}
+                    />
+                  </Suspense>
                 )}
               </motion.div>
             ))}
@@ -1,7 +1,7 @@
 import { useState } from "react";
 import { ChevronDown, ChevronRight, FileText } from "lucide-react";
 
-interface ReferenceItem {
+export interface ReferenceItem {
   key: string;
   label: string;
   detail?: string;
@@ -9,15 +9,75 @@ interface ReferenceItem {
   url?: string;
 }
 
-interface ReferenceListProps {
+// Toggling only swaps which prebuilt chevron is shown; the title span is
+// untouched.
+const CHEVRON_OPEN = (
+  <ChevronDown className="h-3.5 w-3.5 text-muted-foreground" />
+);
+const CHEVRON_CLOSED = (
+  <ChevronRight className="h-3.5 w-3.5 text-muted-foreground" />
+);
+
+// Every row shows the same icon; one shared element instead of one per row.
+const ROW_ICON = (
+  <FileText className="mt-0.5 h-3 w-3 shrink-0 text-muted-foreground" />
+);
+
+// Rows shown per list. Anything past this is never mapped or rendered; the
+// title still carries the full count.
+const DISPLAY_LIMIT = 20;
+
+// Sources arrays belong to finished (immutable) answers, so the mapped items
+// — label and preview strings included — are kept per array and reused when
+// a list is collapsed and reopened or the message remounts. The outer map is
+// keyed by the mapper, so the same array rendered through two different
+// `toItem`s never shares items.
+const ITEM_CACHE = new WeakMap<object, WeakMap<object, ReferenceItem[]>>();
+
+function itemsFor<T>(
+  sources: T[],
+  toItem: (source: T, index: number) => ReferenceItem,
+): ReferenceItem[] {
+  let byMapper = ITEM_CACHE.get(toItem);
+  if (!byMapper) {
+    byMapper = new WeakMap();
+    ITEM_CACHE.set(toItem, byMapper);
+  }
+  let items = byMapper.get(sources);
+  if (!items) {
+    items = sources.slice(0, DISPLAY_LIMIT).map(toItem);
+    byMapper.set(sources, items);
+  }
+  return items;
+}
+
+interface ReferenceListProps<T> {
   title: string;
-  items: ReferenceItem[];
+  /** Raw sources; mapped through `toItem` only once the list is expanded,
+   *  since most reference lists are never opened. */
+  sources: T[];
+  toItem: (source: T, index: number) => ReferenceItem;
   onItemClick?: (item: ReferenceItem) => void;
 }
 
-export function ReferenceList({ title, items, onItemClick }: ReferenceListProps) {
+export function ReferenceList<T>({
+  title,
+  sources,
+  toItem,
+  onItemClick,
+}: ReferenceListProps<T>) {
   const [open, setOpen] = useState(false);
-  if (items.length === 0) return null;
+  if (sources.length === 0) return null;
+  const items = open ? itemsFor(sources, toItem) : null;
+
+  // One delegated handler for the whole list instead of a closure per row;
+  // each row's button carries its index.
+  const handleListClick = (e: React.MouseEvent<HTMLUListElement>) => {
+    const row = (e.target as HTMLElement).closest<HTMLElement>("[data-index]");
+    if (!row || !items) return;
+    onItemClick?.(items[Number(row.dataset.index)]);
+  };
+
   return (
     <div className="rounded-md border border-border/50 bg-muted/30">
       <button
@@ -25,23 +85,22 @@ export function ReferenceList({ title, items, onItemClick }: ReferenceListProps)
         onClick={() => setOpen((v) => !v)}
         className="flex w-full items-center gap-2 px-3 py-2 text-left text-xs font-medium hover:bg-accent/50"
       >
-        {open ? (
-          <ChevronDown className="h-3.5 w-3.5 text-muted-foreground" />
-        ) : (
-          <ChevronRight className="h-3.5 w-3.5 text-muted-foreground" />
-        )}
+        {open ? CHEVRON_OPEN : CHEVRON_CLOSED}
         <span>{title}</span>
       </button>
-      {open && (
-        <ul className="divide-y divide-border/40 px-3 pb-2">
-          {items.map((item) => (
+      {items && (
+        <ul
+          className="divide-y divide-border/40 px-3 pb-2"
+          onClick={handleListClick}
+        >
+          {items.map((item, i) => (
             <li key={item.key}>
               <button
                 type="button"
-                onClick={() => onItemClick?.(item)}
+                data-index={i}
                 className="flex w-full items-start gap-2 py-2 text-left text-xs hover:text-primary"
               >
-                <FileText className="mt-0.5 h-3 w-3 shrink-0 text-muted-foreground" />
+                {ROW_ICON}
                 <div className="flex-1 space-y-0.5 min-w-0">
                   <div className="font-medium truncate">{item.label}</div>
                   {item.detail && (
@@ -53,6 +112,11 @@ export function ReferenceList({ title, items, onItemClick }: ReferenceListProps)
               </button>
             </li>
           ))}
+          {sources.length > items.length && (
+            <li className="py-2 text-xs text-muted-foreground">
+              …and {sources.length - items.length} more
+            </li>
+          )}
         </ul>
       )}
     </div>
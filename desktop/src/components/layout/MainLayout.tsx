@@ -138,7 +138,9 @@ export function MainLayout() {
           <ResizablePanel id="chat">
             <ChatPanel
               documentPath={originalPath}
-              onJumpToPage={(p) => setScrollToPage(p)}
+              // The state setter is referentially stable, which keeps the
+              // memoized chat messages from re-rendering with the layout.
+              onJumpToPage={setScrollToPage}
               showing={showChat}
             />
           </ResizablePanel>
@@ -52,6 +52,9 @@ export function ThemeProvider({ children }: { children: React.ReactNode }) {
   }, [resolvedTheme]);
 
   const setTheme = (t: Theme) => {
+    // localStorage writes are synchronous; re-picking the current theme
+    // shouldn't touch storage or re-render the whole tree.
+    if (t === theme) return;
     localStorage.setItem(STORAGE_KEY, t);
     setThemeState(t);
   };
@@ -1,10 +1,11 @@
 #!/usr/bin/env python3
 """Standalone runner for the PDFusion sidecar.
 
-In production, the Tauri shell (`desktop/src-tauri`) spawns this same module
-with `python -m desktop_pdf_translator.api.server`. During development you can
-run `python main.py` to start the sidecar on its own and hit it with curl, or
-to debug it before launching the desktop app.
+This is also the entry point of the frozen sidecar (`pdfusion-sidecar.spec`
+builds it with PyInstaller), which the Tauri shell (`desktop/src-tauri`)
+spawns in release builds. During development you can run `python main.py` to
+start the sidecar on its own and hit it with curl, or to debug it before
+launching the desktop app.
 
 For the full desktop UI, see `desktop/README.md` and run `pnpm tauri dev`
 from the `desktop/` folder.
@@ -12,7 +13,11 @@ from the `desktop/` folder.
 
 from __future__ import annotations
 
+import atexit
 import logging
+import logging.handlers
+import os
+import queue
 import sys
 from pathlib import Path
 
@@ -24,16 +29,34 @@ def _bootstrap_path() -> None:
 
 
 def _setup_logging() -> None:
-    log_dir = Path.home() / "AppData" / "Local" / "PDFusion" / "logs"
-    log_dir.mkdir(parents=True, exist_ok=True)
-    logging.basicConfig(
-        level=logging.INFO,
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        handlers=[
-            logging.FileHandler(log_dir / "app.log"),
-            logging.StreamHandler(sys.stderr),
-        ],
+    # Handlers run on a QueueListener thread so a slow console or disk never
+    # blocks the request path; the root logger only enqueues records.
+    formatter = logging.Formatter(
+        "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
     )
+    handlers: list[logging.Handler] = [logging.StreamHandler(sys.stderr)]
+    # The frozen sidecar always writes app.log: the Tauri shell only relays our
+    # stderr to its own, which a windowless release build never shows. Dev
+    # runs log to stderr unless PDFUSION_LOG_FILE=1.
+    if getattr(sys, "frozen", False) or os.getenv("PDFUSION_LOG_FILE") == "1":
+        log_dir = Path.home() / "AppData" / "Local" / "PDFusion" / "logs"
+        log_dir.mkdir(parents=True, exist_ok=True)
+        handlers.append(logging.FileHandler(log_dir / "app.log", encoding="utf-8"))
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    log_queue: queue.Queue = queue.Queue(-1)
+    listener = logging.handlers.QueueListener(
+        log_queue, *handlers, respect_handler_level=True
+    )
+    listener.start()
+    # stop() drains whatever is still queued before the process exits.
+    atexit.register(listener.stop)
+
+    # No formatter on the QueueHandler: the listener's handlers format.
+    root = logging.getLogger()
+    root.setLevel(logging.INFO)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
     for noisy in ("urllib3", "requests", "uvicorn.access"):
         logging.getLogger(noisy).setLevel(logging.WARNING)
 
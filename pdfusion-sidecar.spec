@@ -44,6 +44,12 @@ hiddenimports = [
     # pydantic v2 stack
     "pydantic_settings",
 
+    # Our own config package resolves its exports lazily via
+    # `importlib.import_module` (config/__init__.py), so its submodules are
+    # invisible to static analysis.
+    "desktop_pdf_translator.config.models",
+    "desktop_pdf_translator.config.manager",
+
     # chromadb dynamic backends
     "chromadb.api.fastapi",
     "chromadb.telemetry.product.posthog",
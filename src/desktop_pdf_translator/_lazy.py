@@ -0,0 +1,86 @@
+"""
+Lazy-import helpers.
+
+Several of our dependencies (babeldoc, the RAG stack, pydantic + the config
+stack) take anywhere from tens of milliseconds to seconds to import. These
+helpers defer that cost to first use so the sidecar can print its READY
+handshake without paying for code paths the session may never touch.
+
+PyInstaller can't see module names passed around as strings — anything loaded
+through these helpers must be reachable by a static import elsewhere, a
+`collect_submodules` call, or a hiddenimports entry in pdfusion-sidecar.spec.
+"""
+
+import importlib
+import sys
+from types import ModuleType
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+class _LazyModule:
+    """Stand-in for a module that is imported on first attribute access."""
+
+    __slots__ = ("_name", "_module")
+
+    def __init__(self, name: str):
+        self._name = name
+        self._module: Optional[ModuleType] = None
+
+    def _load(self) -> ModuleType:
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return self._module
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self._load(), attr)
+
+    def __dir__(self) -> List[str]:
+        return dir(self._load())
+
+    def __repr__(self) -> str:
+        state = "loaded" if self._module is not None else "not loaded"
+        return f"<lazy module {self._name!r} ({state})>"
+
+
+def lazy_import(name: str) -> Any:
+    """Return module ``name``, importing it on first attribute access.
+
+    If the module is already in ``sys.modules`` it is returned as is.
+    ImportError surfaces at the first attribute access, not here.
+    """
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    return _LazyModule(name)
+
+
+def lazy_exports(
+    package: str, exports: Dict[str, str]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """Build PEP 562 ``__getattr__`` / ``__dir__`` hooks for a package.
+
+    Args:
+        package: The package's ``__name__``.
+        exports: Public name -> submodule (relative, without the leading dot)
+            that defines it.
+
+    Usage in an ``__init__.py``::
+
+        __getattr__, __dir__ = lazy_exports(__name__, {"Foo": "foo"})
+
+    Resolved values are cached on the package module, so later lookups skip
+    ``__getattr__`` entirely.
+    """
+
+    def __getattr__(name: str) -> Any:
+        submodule = exports.get(name)
+        if submodule is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(f".{submodule}", package), name)
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[package])) | set(exports))
+
+    return __getattr__, __dir__
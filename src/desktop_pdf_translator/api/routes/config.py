@@ -1,18 +1,20 @@
 """Configuration + API key management endpoints."""
 
 import asyncio
+import hashlib
 import logging
+import time
+from collections import OrderedDict
 from fastapi import APIRouter, Depends, HTTPException
 
 from ...processors.pdf_cache import get_pdf_cache
 from ...config import (
-    AppSettings,
     LanguageCode,
     TranslationService,
     get_config_manager,
     get_settings,
 )
-from ...translators import TranslatorFactory, get_translation_cache
+from ...translators.translation_cache import get_translation_cache
 from ..auth import require_token
 from ..schemas import (
     APIKeyMaskedSettings,
@@ -31,6 +33,37 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/config", tags=["config"], dependencies=[Depends(require_token)])
 
+_LLM_SERVICES = (
+    TranslationService.OPENAI,
+    TranslationService.GEMINI,
+    TranslationService.ANTHROPIC,
+)
+
+# Which LLM wins the auto-switch away from Argos when several keys arrive in
+# the same PUT.
+_AUTO_SWITCH_PRIORITY = (
+    TranslationService.OPENAI,
+    TranslationService.ANTHROPIC,
+    TranslationService.GEMINI,
+)
+
+# (service, sha256(api_key), model) -> (time.monotonic() at check, message),
+# for credentials that already validated. The settings page re-validates on
+# every click and each miss costs a provider round trip. Only successes are
+# kept — a failure may be transient (network, rate limit) and must be retried
+# for real. Entries expire after _VALIDATION_TTL_S so a revoked or exhausted
+# key stops reporting valid, and a PUT that changes a service's key drops that
+# service's entries. Keys are hashed so the plaintext never sits in this table.
+_ValidationKey = tuple[TranslationService, str, str | None]
+_VALIDATION_CACHE: "OrderedDict[_ValidationKey, tuple[float, str]]" = OrderedDict()
+_VALIDATION_CACHE_SIZE = 8
+_VALIDATION_TTL_S = 300.0
+
+
+def _forget_validations(service: TranslationService) -> None:
+    for key in [k for k in _VALIDATION_CACHE if k[0] == service]:
+        del _VALIDATION_CACHE[key]
+
 
 def _mask(service_settings) -> APIKeyMaskedSettings:
     # ArgosSettings has no api_key attribute, so getattr falls through to False.
@@ -49,10 +82,10 @@ async def get_config() -> ConfigResponse:
         gemini=_mask(s.gemini),
         anthropic=_mask(s.anthropic),
         argos=_mask(s.argos),
-        translation=s.translation.dict(),
-        rag=s.rag.dict(),
-        gui=s.gui.dict(),
-        processing=s.processing.dict(),
+        translation=s.translation.model_dump(),
+        rag=s.rag.model_dump(),
+        gui=s.gui.model_dump(),
+        processing=s.processing.model_dump(),
         debug_mode=s.debug_mode,
     )
 
@@ -60,96 +93,120 @@ async def get_config() -> ConfigResponse:
 @router.put("", response_model=ConfigResponse)
 async def update_config(payload: ConfigUpdateRequest) -> ConfigResponse:
     mgr = get_config_manager()
-    current = mgr.settings.dict()
+    current = mgr.settings
+    # Section -> partial dict of fields this PUT touches. update_settings
+    # merges it into the live settings and revalidates only those sections.
+    patch: dict[str, dict] = {}
 
     # Track which LLM services received a non-empty key in *this* PUT, so we
     # can auto-promote the user's preferred_service from Argos to that LLM
     # (priority: openai > anthropic > gemini if multiple keys arrive at once).
-    LLM_SERVICES = (
-        TranslationService.OPENAI,
-        TranslationService.GEMINI,
-        TranslationService.ANTHROPIC,
-    )
     newly_keyed: list[TranslationService] = []
 
-    for service in LLM_SERVICES:
+    for service in _LLM_SERVICES:
         update = getattr(payload, service.value)
         if update is None:
             continue
+        section = patch.setdefault(service.value, {})
         if update.api_key is not None:
             new_key = update.api_key or None
-            current[service.value]["api_key"] = new_key
+            section["api_key"] = new_key
             if new_key:
                 newly_keyed.append(service)
         if update.model is not None:
-            current[service.value]["model"] = update.model
+            section["model"] = update.model
 
+    translation = patch.setdefault("translation", {})
     if payload.preferred_service is not None:
-        current["translation"]["preferred_service"] = payload.preferred_service.value
-    elif (
-        current["translation"].get("preferred_service") == TranslationService.ARGOS.value
-        and newly_keyed
-    ):
-        priority = (
-            TranslationService.OPENAI,
-            TranslationService.ANTHROPIC,
-            TranslationService.GEMINI,
+        translation["preferred_service"] = payload.preferred_service.value
+    elif current.translation.preferred_service == TranslationService.ARGOS and newly_keyed:
+        chosen = next(
+            (s for s in _AUTO_SWITCH_PRIORITY if s in newly_keyed), newly_keyed[0]
         )
-        chosen = next((s for s in priority if s in newly_keyed), newly_keyed[0])
-        current["translation"]["preferred_service"] = chosen.value
+        translation["preferred_service"] = chosen.value
         logger.info(
             "Auto-switching preferred_service argos -> %s after key save",
             chosen.value,
         )
 
     if payload.default_source_lang is not None:
-        current["translation"]["default_source_lang"] = payload.default_source_lang.value
+        translation["default_source_lang"] = payload.default_source_lang.value
     if payload.default_target_lang is not None:
-        current["translation"]["default_target_lang"] = payload.default_target_lang.value
+        translation["default_target_lang"] = payload.default_target_lang.value
     if payload.rag_enabled is not None:
-        current["rag"]["enabled"] = payload.rag_enabled
+        patch["rag"] = {"enabled": payload.rag_enabled}
     if payload.max_parallel_chunks is not None:
-        current["processing"]["max_parallel_chunks"] = payload.max_parallel_chunks
+        patch["processing"] = {"max_parallel_chunks": payload.max_parallel_chunks}
     if payload.cache_translations is not None:
-        current["translation"]["cache_translations"] = payload.cache_translations
+        translation["cache_translations"] = payload.cache_translations
     if payload.cache_translated_pdfs is not None:
-        current["translation"]["cache_translated_pdfs"] = payload.cache_translated_pdfs
+        translation["cache_translated_pdfs"] = payload.cache_translated_pdfs
 
-    new_settings = AppSettings(**current)
-    if not mgr.save_settings(new_settings):
+    # update_settings swaps in the new (frozen) settings on success, so the
+    # singleton never needs patching by hand.
+    if not mgr.update_settings(**patch):
         raise HTTPException(status_code=500, detail="Failed to save settings")
-    mgr._settings = new_settings  # refresh cached singleton
+    for service in _LLM_SERVICES:
+        if "api_key" in patch.get(service.value, {}):
+            _forget_validations(service)
     return await get_config()
 
 
+def _check_credentials(service: TranslationService, **kwargs) -> tuple[bool, str]:
+    """Blocking: build a translator and run its validation. Construction
+    imports the provider SDK and validation makes a network round trip, so
+    callers run this via `asyncio.to_thread`."""
+    # Imported here rather than at module load: the factory drags in every
+    # translator implementation, and only this endpoint needs it.
+    from ...translators import TranslatorFactory
+
+    translator = TranslatorFactory.create_translator(
+        service=service,
+        lang_in="en",
+        lang_out="vi",
+        **kwargs,
+    )
+    return translator.validate_configuration()
+
+
 @router.post("/validate", response_model=ValidateResponse)
 async def validate_credentials(payload: ValidateRequest) -> ValidateResponse:
     """Spin up a translator instance with the supplied credentials and validate."""
     # Argos has no API key — short-circuit and report the install state.
     if payload.service == TranslationService.ARGOS:
         try:
-            translator = TranslatorFactory.create_translator(
-                service=TranslationService.ARGOS,
-                lang_in="en",
-                lang_out="vi",
+            is_valid, message = await asyncio.to_thread(
+                _check_credentials, TranslationService.ARGOS
             )
-            is_valid, message = translator.validate_configuration()
             return ValidateResponse(valid=is_valid, message=message)
         except Exception as exc:  # noqa: BLE001
             logger.exception("Argos validation failed")
             return ValidateResponse(valid=False, message=str(exc))
 
+    cache_key = (
+        payload.service,
+        hashlib.sha256((payload.api_key or "").encode("utf-8")).hexdigest(),
+        payload.model or None,
+    )
+    cached = _VALIDATION_CACHE.get(cache_key)
+    if cached is not None:
+        checked_at, message = cached
+        if time.monotonic() - checked_at < _VALIDATION_TTL_S:
+            _VALIDATION_CACHE.move_to_end(cache_key)
+            return ValidateResponse(valid=True, message=message)
+        del _VALIDATION_CACHE[cache_key]
+
     try:
         kwargs = {"api_key": payload.api_key}
         if payload.model:
             kwargs["model"] = payload.model
-        translator = TranslatorFactory.create_translator(
-            service=payload.service,
-            lang_in="en",
-            lang_out="vi",
-            **kwargs,
+        is_valid, message = await asyncio.to_thread(
+            _check_credentials, payload.service, **kwargs
         )
-        is_valid, message = translator.validate_configuration()
+        if is_valid:
+            _VALIDATION_CACHE[cache_key] = (time.monotonic(), message)
+            if len(_VALIDATION_CACHE) > _VALIDATION_CACHE_SIZE:
+                _VALIDATION_CACHE.popitem(last=False)
         return ValidateResponse(valid=is_valid, message=message)
     except Exception as exc:  # noqa: BLE001 — we want to surface any error to the UI
         logger.exception("Credential validation failed")
@@ -180,15 +237,20 @@ _SERVICE_MODELS = {
 }
 
 
+# Everything above is static, so the response is assembled once at import
+# rather than rebuilding the option models on every settings-page open.
+_OPTIONS = OptionsResponse(
+    languages=[LanguageOption(code=c.value, label=_LANGUAGE_LABELS[c]) for c in LanguageCode],
+    services=[
+        ServiceOption(code=s.value, label=_SERVICE_MODELS[s][0], models=_SERVICE_MODELS[s][1])
+        for s in TranslationService
+    ],
+)
+
+
 @router.get("/options", response_model=OptionsResponse)
 async def get_options() -> OptionsResponse:
-    return OptionsResponse(
-        languages=[LanguageOption(code=c.value, label=_LANGUAGE_LABELS[c]) for c in LanguageCode],
-        services=[
-            ServiceOption(code=s.value, label=_SERVICE_MODELS[s][0], models=_SERVICE_MODELS[s][1])
-            for s in TranslationService
-        ],
-    )
+    return _OPTIONS
 
 
 # ---------------------------------------------------------------------------
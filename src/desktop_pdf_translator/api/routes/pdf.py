@@ -1,6 +1,5 @@
 """PDF file streaming for the frontend pdf.js viewer."""
 
-import logging
 from pathlib import Path
 
 from fastapi import APIRouter, Depends, HTTPException, Query
@@ -8,8 +7,6 @@ from fastapi.responses import FileResponse
 
 from ..auth import require_token
 
-logger = logging.getLogger(__name__)
-
 router = APIRouter(prefix="/pdf", tags=["pdf"], dependencies=[Depends(require_token)])
 
 
@@ -4,38 +4,46 @@ import asyncio
 import logging
 import time
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from sse_starlette.sse import EventSourceResponse
 
-from ...rag.document_processor import ScientificPDFProcessor
-from ...rag.rag_chain import EnhancedRAGChain
-from ...rag.vector_store import ChromaDBManager
 from ..auth import require_token
 from ..jobs import Job, get_registry, serialize_sse_event
 from ..schemas import AskRequest, IndexRequest, JobAccepted
 
+# The RAG stack (chromadb, sentence-transformers, camelot) is an optional extra
+# that takes seconds to import, so it is imported on first index/ask rather
+# than when the sidecar boots.
+if TYPE_CHECKING:
+    from ...rag.rag_chain import EnhancedRAGChain
+    from ...rag.vector_store import ChromaDBManager
+
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/rag", tags=["rag"], dependencies=[Depends(require_token)])
 
 # Lazily initialized singletons. The RAG stack is heavy (loads embedding models, etc.)
 # so we only instantiate on first use.
-_vector_store: Optional[ChromaDBManager] = None
-_rag_chain: Optional[EnhancedRAGChain] = None
+_vector_store: "Optional[ChromaDBManager]" = None
+_rag_chain: "Optional[EnhancedRAGChain]" = None
 _init_lock = asyncio.Lock()
 
 
-def _build_chain() -> EnhancedRAGChain:
-    """Blocking: constructs ChromaDB + loads the SentenceTransformer model."""
+def _build_chain() -> "EnhancedRAGChain":
+    """Blocking: imports the RAG stack, constructs ChromaDB + loads the
+    SentenceTransformer model."""
     global _vector_store, _rag_chain
+    from ...rag.rag_chain import EnhancedRAGChain
+    from ...rag.vector_store import ChromaDBManager
+
     _vector_store = ChromaDBManager()
     _rag_chain = EnhancedRAGChain(_vector_store)
     return _rag_chain
 
 
-async def _get_chain() -> EnhancedRAGChain:
+async def _get_chain() -> "EnhancedRAGChain":
     async with _init_lock:
         if _rag_chain is None:
             # First use loads the embedding model (seconds of CPU + disk).
@@ -45,7 +53,7 @@ async def _get_chain() -> EnhancedRAGChain:
         return _rag_chain
 
 
-async def _get_store() -> ChromaDBManager:
+async def _get_store() -> "ChromaDBManager":
     await _get_chain()
     assert _vector_store is not None
     return _vector_store
@@ -56,6 +64,15 @@ async def _get_store() -> ChromaDBManager:
 # ---------------------------------------------------------------------------
 
 
+def _extract_chunks(file_path: Path) -> list:
+    """Blocking: imports the document processor (camelot/pdfplumber load at
+    import time) and runs the fitz/camelot/pdfplumber extraction. Call it via
+    `asyncio.to_thread` so neither step stalls the event loop."""
+    from ...rag.document_processor import ScientificPDFProcessor
+
+    return ScientificPDFProcessor().process_pdf(file_path)
+
+
 async def _run_index(job: Job, payload: IndexRequest) -> None:
     file_path = Path(payload.file_path)
     document_id = payload.document_id or file_path.stem
@@ -73,9 +90,7 @@ async def _run_index(job: Job, payload: IndexRequest) -> None:
             return
 
         await job.emit("progress", {"stage": "Extracting text", "progress": 20})
-        processor = ScientificPDFProcessor()
-        # Blocking fitz/camelot/pdfplumber work — keep it off the event loop.
-        chunks = await asyncio.to_thread(processor.process_pdf, file_path)
+        chunks = await asyncio.to_thread(_extract_chunks, file_path)
 
         if job.cancelled:
             await job.finish("cancelled", {})
@@ -15,6 +15,7 @@ Any process that can read this stdout line can talk to the sidecar.
 from __future__ import annotations
 
 import asyncio
+import importlib
 import logging
 import shutil
 import socket
@@ -91,6 +92,36 @@ def _prewarm_argos() -> None:
         logger.warning("Argos pre-warm failed (non-fatal): %s", exc)
 
 
+# Provider SDK each LLM translator imports when it's constructed.
+_LLM_SDK_MODULES = {
+    TranslationService.OPENAI: "openai",
+    TranslationService.GEMINI: "google.genai",
+    TranslationService.ANTHROPIC: "anthropic",
+}
+
+
+def _prewarm_llm_sdks(services: list[TranslationService]) -> None:
+    """Import the SDKs of the LLM services that have a key configured, so
+    building their translator later doesn't pay the import."""
+    for service in services:
+        try:
+            importlib.import_module(_LLM_SDK_MODULES[service])
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("%s SDK pre-warm failed (non-fatal): %s", service.value, exc)
+
+
+def _prewarm_babeldoc() -> None:
+    """Import BabelDOC in the background so the first translation doesn't
+    pay its multi-second import on the request path."""
+    try:
+        from ..processors.processor import _load_babeldoc
+
+        _load_babeldoc()
+        logger.info("BabelDOC pre-warm: done")
+    except Exception as exc:  # noqa: BLE001
+        logger.warning("BabelDOC pre-warm failed (non-fatal): %s", exc)
+
+
 def _sweep_orphan_translate_dirs(max_age_seconds: int = 3600) -> int:
     """Remove `pdfusion-translate-*` dirs left behind by a prior sidecar that
     crashed or was killed before its next-job cleanup could fire.
@@ -154,6 +185,19 @@ async def _lifespan(app: FastAPI):
             name="argos-prewarm",
             daemon=True,
         ).start()
+    keyed = [s for s in _LLM_SDK_MODULES if settings.has_api_key(s)]
+    if keyed:
+        threading.Thread(
+            target=_prewarm_llm_sdks,
+            args=(keyed,),
+            name="llm-sdk-prewarm",
+            daemon=True,
+        ).start()
+    threading.Thread(
+        target=_prewarm_babeldoc,
+        name="babeldoc-prewarm",
+        daemon=True,
+    ).start()
     # Paragraph-cache GC in the background so startup isn't delayed.
     gc_task = asyncio.create_task(asyncio.to_thread(_gc_translation_cache))
     _startup_tasks.add(gc_task)
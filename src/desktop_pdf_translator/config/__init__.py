@@ -1,21 +1,33 @@
 """
 Configuration package for desktop PDF translator.
+
+Exports are resolved lazily (PEP 562) so importing the package doesn't pull in
+pydantic, the TOML/dotenv stack and the encryption utils until a name is
+actually used.
 """
 
-from .models import (
-    AppSettings,
-    LanguageCode,
-    TranslationService,
-    OpenAISettings,
-    GeminiSettings,
-    AnthropicSettings,
-    ArgosSettings,
-    TranslationSettings,
-    GUISettings,
-    ProcessingSettings,
-    FileMetadata
-)
-from .manager import ConfigManager, get_config_manager, get_settings
+from .._lazy import lazy_exports
+
+# Public name -> submodule that defines it.
+_LAZY_EXPORTS = {
+    # Models
+    "AppSettings": "models",
+    "LanguageCode": "models",
+    "TranslationService": "models",
+    "OpenAISettings": "models",
+    "GeminiSettings": "models",
+    "AnthropicSettings": "models",
+    "ArgosSettings": "models",
+    "TranslationSettings": "models",
+    "GUISettings": "models",
+    "ProcessingSettings": "models",
+    "FileMetadata": "models",
+
+    # Manager
+    "ConfigManager": "manager",
+    "get_config_manager": "manager",
+    "get_settings": "manager",
+}
 
 __all__ = [
     # Models
@@ -35,4 +47,7 @@ __all__ = [
     "ConfigManager",
     "get_config_manager",
     "get_settings"
-]
\ No newline at end of file
+]
+
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_EXPORTS)
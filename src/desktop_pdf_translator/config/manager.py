@@ -2,23 +2,142 @@
 Configuration manager for desktop PDF translator.
 """
 
+import copy
+import functools
+import hashlib
+import json
 import os
+import sys
 import logging
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Any, Callable, Dict, Optional, Set, Tuple
 
-import tomlkit
-from pydantic import ValidationError
+from pydantic import BaseModel, ValidationError
 
 from .models import AppSettings
 from ..utils import encrypt_api_key, decrypt_api_key, is_encrypted
 
-# Try to import python-dotenv for .env file support
-from dotenv import load_dotenv
+# The TOML parser/writer and python-dotenv are imported inside the methods
+# that use them: they're only needed on the cold load/save path, not by every
+# importer of this module.
 
 
 logger = logging.getLogger(__name__)
 
+# Services that carry an API key (encrypted on disk, overridable from env).
+# Adding a service is a one-line edit here.
+_API_KEY_SERVICES = ("openai", "gemini", "anthropic")
+
+# Default config dir: the user's AppData directory on Windows.
+_DEFAULT_CONFIG_DIR = Path.home() / "AppData" / "Local" / "PDFusion"
+
+# Project-root .env, only meaningful in dev. Resolved via __file__, NOT
+# Path.cwd(), which would resolve to C:\Program Files\PDFusion\ on an
+# installed Start-Menu launch and is non-writable / wrong.
+# `parents[3]` from `<repo>/src/desktop_pdf_translator/config/manager.py`
+# → repo root in dev; in the PyInstaller bundle it points at the install
+# dir which never contains a .env, so this is a harmless miss there.
+# Resolved once at import instead of on every ConfigManager construction.
+_PROJECT_ROOT_ENV = Path(__file__).resolve().parents[3] / ".env"
+
+# Parsed + decrypted config-file contents, keyed by path and stamped with the
+# (st_mtime_ns, st_size) they were read at. Repeat loads of an unchanged file
+# (fresh ConfigManager instances, reloads) skip the TOML parse and the per-key
+# decryption. Only the file layer is cached — env overrides are re-applied on
+# every load.
+_PARSED_CACHE: Dict[Path, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+
+# JSON copy of config.toml's raw contents, next to it in the config dir, stamped
+# with the TOML file's (st_mtime_ns, st_size). See _read_raw_config.
+_JSON_CACHE_NAME = "config.cache.json"
+
+# Config dirs already created by this process; saves a mkdir per manager.
+_ENSURED_DIRS: Set[Path] = set()
+
+# Config dir -> the .env file loaded for it (None if none was found).
+_DOTENV_RESOLVED: Dict[Path, Optional[Path]] = {}
+
+_TRUTHY = frozenset({"true", "1", "yes"})
+
+
+def _parse_bool(value: str) -> bool:
+    return value.lower() in _TRUTHY
+
+
+# SHA-256 of a plaintext API key -> (ciphertext, salt) it is stored as.
+# Seeded on decrypt and on encrypt, so saving an unchanged key reuses its
+# existing ciphertext instead of re-encrypting it under a fresh salt.
+_CIPHERTEXTS: Dict[bytes, Tuple[str, str]] = {}
+
+# Env var -> (path into the config dict, parser). Empty values count as unset.
+# Per-service API key + model overrides come first, e.g. OPENAI_API_KEY /
+# OPENAI_MODEL.
+_ENV_SPEC: Tuple[Tuple[str, Tuple[str, ...], Callable[[str], Any]], ...] = (
+    *(
+        (f"{service.upper()}_{suffix}", (service, key), str)
+        for service in _API_KEY_SERVICES
+        for suffix, key in (("API_KEY", "api_key"), ("MODEL", "model"))
+    ),
+    ("DEBUG_MODE", ("debug_mode",), _parse_bool),
+    ("MAX_PAGES", ("translation", "max_pages"), int),
+    ("MAX_FILE_SIZE_MB", ("translation", "max_file_size_mb"), float),
+)
+
+# Their values, in _ENV_SPEC order, form _parse_environment's cache key.
+_ENV_VARS = tuple(name for name, _, _ in _ENV_SPEC)
+
+
+@functools.lru_cache(maxsize=4)
+def _parse_environment(env_values: Tuple[Optional[str], ...]) -> Dict[str, Any]:
+    """Parse config overrides from a snapshot of the `_ENV_VARS` values.
+
+    Cached per distinct snapshot: repeat loads skip the parsing, while a
+    changed environment (e.g. a test patching os.environ) is re-parsed.
+    Callers must not mutate the result. `_parse_environment.cache_clear()`
+    resets it.
+    """
+    env_config: Dict[str, Any] = {}
+    for (name, path, parse), raw in zip(_ENV_SPEC, env_values):
+        if not raw:
+            continue
+        try:
+            value = parse(raw)
+        except ValueError:
+            logger.warning(f"Invalid {name} value: {raw}")
+            continue
+        node = env_config
+        for key in path[:-1]:
+            node = node.setdefault(key, {})
+        node[path[-1]] = value
+    return env_config
+
+
+def _atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Write `data` to `path` via a sibling temp file + os.replace.
+
+    A crash mid-write leaves the previous file intact rather than a
+    truncated one.
+    """
+    tmp_path = path.with_name(path.name + ".tmp")
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _tomllib():
+    """Return the TOML parser: stdlib tomllib, or its tomli backport on 3.10."""
+    if sys.version_info >= (3, 11):
+        import tomllib
+    else:
+        import tomli as tomllib
+    return tomllib
+
 
 class ConfigManager:
     """Manages application configuration with TOML files and environment variables."""
@@ -29,13 +148,11 @@ class ConfigManager:
         Args:
             config_dir: Directory for configuration files. Defaults to user config dir.
         """
-        if config_dir is None:
-            # Default to user's AppData directory on Windows
-            self.config_dir = Path.home() / "AppData" / "Local" / "PDFusion"
-        else:
-            self.config_dir = Path(config_dir)
+        self.config_dir = _DEFAULT_CONFIG_DIR if config_dir is None else Path(config_dir)
         
-        self.config_dir.mkdir(parents=True, exist_ok=True)
+        if self.config_dir not in _ENSURED_DIRS:
+            self.config_dir.mkdir(parents=True, exist_ok=True)
+            _ENSURED_DIRS.add(self.config_dir)
         self.config_file = self.config_dir / "config.toml"
         
         # Initialize with default settings
@@ -57,15 +174,13 @@ class ConfigManager:
         config_data = {}
         
         # Load from TOML file if it exists
-        if self.config_file.exists():
-            try:
-                with open(self.config_file, "r", encoding="utf-8") as f:
-                    file_config = tomlkit.load(f)
-                config_data.update(dict(file_config))
-                self._decrypt_sensitive_data(config_data)
+        try:
+            file_config = self._read_config_file()
+            if file_config is not None:
+                config_data.update(file_config)
                 logger.info(f"Loaded configuration from {self.config_file}")
-            except Exception as e:
-                logger.warning(f"Failed to load config file: {e}")
+        except Exception as e:
+            logger.warning(f"Failed to load config file: {e}")
         
         # Override with environment variables
         env_config = self._load_from_environment()
@@ -73,7 +188,7 @@ class ConfigManager:
         
         # Create settings model with validation
         try:
-            settings = AppSettings(**config_data)
+            settings = AppSettings.model_validate(config_data)
             logger.info("Configuration loaded successfully")
             return settings
         except ValidationError as e:
@@ -88,6 +203,55 @@ class ConfigManager:
             )
             return self._load_with_invalid_fields_dropped(config_data, e)
 
+    def _read_config_file(self) -> Optional[Dict[str, Any]]:
+        """Return the decrypted contents of the config file, or None if absent.
+
+        Served from `_PARSED_CACHE` while the file's mtime and size are
+        unchanged; the caller gets its own copy either way.
+        """
+        try:
+            st = self.config_file.stat()
+        except FileNotFoundError:
+            return None
+        stamp = (st.st_mtime_ns, st.st_size)
+
+        cached = _PARSED_CACHE.get(self.config_file)
+        if cached is not None and cached[0] == stamp:
+            return copy.deepcopy(cached[1])
+
+        file_config = self._read_raw_config(stamp)
+        self._decrypt_sensitive_data(file_config)
+        _PARSED_CACHE[self.config_file] = (stamp, copy.deepcopy(file_config))
+        return file_config
+
+    def _read_raw_config(self, stamp: Tuple[int, int]) -> Dict[str, Any]:
+        """Return the config file's raw contents, API keys still encrypted.
+
+        Warm starts read the JSON side-cache instead when its stamp matches
+        the TOML file's (mtime_ns, size): json is C-accelerated, tomllib is
+        pure Python. The cache holds exactly what config.toml holds, so it
+        never contains a plaintext key.
+        """
+        cache_file = self.config_dir / _JSON_CACHE_NAME
+        try:
+            blob = json.loads(cache_file.read_bytes())
+            if tuple(blob["stamp"]) == stamp and isinstance(blob["data"], dict):
+                return blob["data"]
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+        # One read of the whole file; loads() skips the file-object path.
+        raw = _tomllib().loads(self.config_file.read_bytes().decode("utf-8"))
+        try:
+            _atomic_write_bytes(
+                cache_file,
+                json.dumps({"stamp": list(stamp), "data": raw}).encode("utf-8"),
+            )
+        except (OSError, TypeError, ValueError) as e:
+            # e.g. a hand-written TOML datetime json can't encode
+            logger.debug("Not caching config as JSON: %s", e)
+        return raw
+
     def _load_with_invalid_fields_dropped(
         self, config_data: Dict[str, Any], error: ValidationError
     ) -> AppSettings:
@@ -99,15 +263,13 @@ class ConfigManager:
         Each dropped field reverts to its model default rather than wiping the
         entire configuration.
         """
-        import copy
-
         pruned = copy.deepcopy(config_data)
         for err in error.errors():
             loc = err.get("loc", ())
             self._pop_path(pruned, loc)
 
         try:
-            settings = AppSettings(**pruned)
+            settings = AppSettings.model_validate(pruned)
             logger.info("Configuration loaded after dropping invalid field(s)")
             return settings
         except ValidationError as e2:
@@ -118,7 +280,7 @@ class ConfigManager:
                 if loc:
                     pruned.pop(loc[0], None)
             try:
-                settings = AppSettings(**pruned)
+                settings = AppSettings.model_validate(pruned)
                 logger.info("Configuration loaded after dropping invalid section(s)")
                 return settings
             except ValidationError as e3:
@@ -153,18 +315,18 @@ class ConfigManager:
             True if saved successfully, False otherwise
         """
         try:
-            # Convert to dict and format for TOML
-            config_dict = settings.dict()
+            # TOML has no null, so None fields are dropped during the dump
+            config_dict = settings.model_dump(mode="python", exclude_none=True)
             
             # Prepare sensitive data (API keys) for storage
-            config_dict = self._remove_sensitive_data(config_dict)
-            
-            # Clean None values that can't be serialized to TOML
-            config_dict = self._clean_none_values(config_dict)
+            self._scrub_sensitive_data(config_dict)
             
-            # Write directly using tomlkit.dump without manual document creation
-            with open(self.config_file, "w", encoding="utf-8") as f:
-                tomlkit.dump(config_dict, f)
+            import tomli_w
+
+            _atomic_write_bytes(
+                self.config_file, tomli_w.dumps(config_dict).encode("utf-8")
+            )
+            _PARSED_CACHE.pop(self.config_file, None)
             
             logger.info(f"Settings saved to {self.config_file}")
             return True
@@ -175,86 +337,77 @@ class ConfigManager:
     
     def _load_from_environment(self) -> Dict[str, Any]:
         """Load configuration from environment variables."""
-        env_config = {}
-        
-        # Per-service API key + model overrides, e.g. OPENAI_API_KEY /
-        # OPENAI_MODEL. Adding a service is a one-line edit to this list.
-        for service in ("openai", "gemini", "anthropic"):
-            if api_key := os.getenv(f"{service.upper()}_API_KEY"):
-                env_config.setdefault(service, {})["api_key"] = api_key
-            if model := os.getenv(f"{service.upper()}_MODEL"):
-                env_config.setdefault(service, {})["model"] = model
-
-        # Application settings
-        if debug := os.getenv("DEBUG_MODE"):
-            env_config["debug_mode"] = debug.lower() in ("true", "1", "yes")
-        
-        # Translation settings
-        if max_pages := os.getenv("MAX_PAGES"):
-            try:
-                env_config.setdefault("translation", {})["max_pages"] = int(max_pages)
-            except ValueError:
-                logger.warning(f"Invalid MAX_PAGES value: {max_pages}")
-        
-        if max_size := os.getenv("MAX_FILE_SIZE_MB"):
-            try:
-                env_config.setdefault("translation", {})["max_file_size_mb"] = float(max_size)
-            except ValueError:
-                logger.warning(f"Invalid MAX_FILE_SIZE_MB value: {max_size}")
-        
-        return env_config
+        snapshot = tuple(os.environ.get(name) for name in _ENV_VARS)
+        # Copy: the result is merged into the config dict being built, and
+        # the cached original must stay untouched.
+        return copy.deepcopy(_parse_environment(snapshot))
     
     def _load_dotenv(self) -> None:
         """Load environment variables from .env file if available."""
-        # Look for .env in two well-known locations:
-        #   1. The project root (only meaningful in dev — resolved via __file__,
-        #      NOT Path.cwd(), which would resolve to C:\Program Files\PDFusion\
-        #      on an installed Start-Menu launch and is non-writable / wrong).
-        #   2. The user's config dir under AppData.
-        # `parents[3]` from this file is `<repo>/src/desktop_pdf_translator/config/manager.py`
-        # → repo root in dev; in the PyInstaller bundle it points at the install
-        # dir which never contains a .env, so this is a harmless miss there.
-        project_root_env = Path(__file__).resolve().parents[3] / ".env"
+        # Resolved once per config dir: the first manager loads the file into
+        # os.environ, so later ones have nothing to probe or re-parse.
+        if self.config_dir in _DOTENV_RESOLVED:
+            return
+        _DOTENV_RESOLVED[self.config_dir] = None
+
+        # Look for .env in two well-known locations: the project root (see
+        # _PROJECT_ROOT_ENV) and the user's config dir under AppData.
         env_files = [
-            project_root_env,
+            _PROJECT_ROOT_ENV,
             self.config_dir / ".env",
         ]
         
         for env_file in env_files:
             if env_file.exists():
+                # Installed builds never ship a .env, so python-dotenv is only
+                # imported once one is actually found.
                 try:
-                    load_dotenv(env_file)
+                    from dotenv import load_dotenv
+                except ImportError:
+                    logger.warning(
+                        "Found %s but python-dotenv is not installed", env_file
+                    )
+                    return
+                try:
+                    # Never clobber variables the process was started with.
+                    load_dotenv(env_file, override=False)
+                    _DOTENV_RESOLVED[self.config_dir] = env_file
                     logger.info(f"Loaded environment variables from {env_file}")
                     break
                 except Exception as e:
                     logger.warning(f"Failed to load .env file {env_file}: {e}")
     
-    def _remove_sensitive_data(self, config_dict: Dict[str, Any]) -> Dict[str, Any]:
-        """Remove sensitive data like API keys from config before saving."""
-        safe_config = config_dict.copy()
-
-        for service in ["openai", "gemini", "anthropic"]:
-            if service in safe_config and isinstance(safe_config[service], dict):
-                safe_config[service] = safe_config[service].copy()
-                api_key = safe_config[service].get("api_key")
-                if not api_key:
-                    safe_config[service]["api_key"] = ""
-                    safe_config[service].pop("api_key_salt", None)
-                    continue
-                if isinstance(api_key, str) and api_key.startswith("${"):
-                    safe_config[service]["api_key_salt"] = ""
-                    continue
-                encrypted_key, salt = encrypt_api_key(api_key)
-                safe_config[service]["api_key"] = encrypted_key
-                if salt:
-                    safe_config[service]["api_key_salt"] = salt
-                else:
-                    safe_config[service].pop("api_key_salt", None)
+    def _scrub_sensitive_data(self, config_dict: Dict[str, Any]) -> None:
+        """Encrypt API keys in place before saving.
 
-        return safe_config
+        `config_dict` must be a dump the caller owns (e.g. a fresh
+        `model_dump()`), since its service sections are modified directly.
+        """
+        for service in _API_KEY_SERVICES:
+            service_data = config_dict.get(service)
+            if not isinstance(service_data, dict):
+                continue
+            api_key = service_data.get("api_key")
+            if not api_key:
+                service_data["api_key"] = ""
+                service_data.pop("api_key_salt", None)
+                continue
+            if isinstance(api_key, str) and api_key.startswith("${"):
+                service_data["api_key_salt"] = ""
+                continue
+            digest = hashlib.sha256(api_key.encode("utf-8")).digest()
+            stored = _CIPHERTEXTS.get(digest)
+            if stored is None:
+                stored = _CIPHERTEXTS[digest] = encrypt_api_key(api_key)
+            encrypted_key, salt = stored
+            service_data["api_key"] = encrypted_key
+            if salt:
+                service_data["api_key_salt"] = salt
+            else:
+                service_data.pop("api_key_salt", None)
 
     def _decrypt_sensitive_data(self, config_data: Dict[str, Any]) -> None:
-        for service in ["openai", "gemini", "anthropic"]:
+        for service in _API_KEY_SERVICES:
             if service not in config_data or not isinstance(config_data[service], dict):
                 continue
             service_data = config_data[service]
@@ -263,35 +416,25 @@ class ConfigManager:
             if isinstance(encrypted_key, str) and isinstance(salt, str) and encrypted_key and salt and is_encrypted(encrypted_key):
                 decrypted = decrypt_api_key(encrypted_key, salt)
                 service_data["api_key"] = decrypted
+                if decrypted:
+                    digest = hashlib.sha256(decrypted.encode("utf-8")).digest()
+                    _CIPHERTEXTS[digest] = (encrypted_key, salt)
             service_data.pop("api_key_salt", None)
     
-    def _clean_none_values(self, config_dict: Dict[str, Any]) -> Dict[str, Any]:
-        """Remove None values from config dict to prevent TOML serialization errors."""
-        cleaned = {}
-        
-        for key, value in config_dict.items():
-            if value is None:
-                continue
-            elif isinstance(value, dict):
-                cleaned_nested = self._clean_none_values(value)
-                if cleaned_nested:  # Only add if not empty after cleaning
-                    cleaned[key] = cleaned_nested
-            elif isinstance(value, list):
-                cleaned_list = [item for item in value if item is not None]
-                if cleaned_list:  # Only add if not empty after cleaning
-                    cleaned[key] = cleaned_list
-            else:
-                cleaned[key] = value
-        
-        return cleaned
-    
-    def _deep_merge(self, target: Dict[str, Any], source: Dict[str, Any]) -> None:
+    @staticmethod
+    def _deep_merge(target: Dict[str, Any], source: Dict[str, Any]) -> None:
         """Deep merge source dictionary into target dictionary."""
-        for key, value in source.items():
-            if key in target and isinstance(target[key], dict) and isinstance(value, dict):
-                self._deep_merge(target[key], value)
-            else:
-                target[key] = value
+        # Explicit work stack instead of recursion: one frame for the whole
+        # merge rather than one per nested dict.
+        stack = [(target, source)]
+        while stack:
+            dst, src = stack.pop()
+            for key, value in src.items():
+                current = dst.get(key)
+                if isinstance(current, dict) and isinstance(value, dict):
+                    stack.append((current, value))
+                else:
+                    dst[key] = value
     
     def reset_to_defaults(self) -> AppSettings:
         """Reset settings to defaults and save."""
@@ -310,14 +453,44 @@ class ConfigManager:
             True if updated successfully, False otherwise
         """
         try:
-            # Get current settings as dict
-            current_dict = self.settings.dict()
-            
-            # Update with provided values
-            self._deep_merge(current_dict, kwargs)
-            
-            # Validate new settings
-            new_settings = AppSettings(**current_dict)
+            current = self.settings
+            fields = AppSettings.model_fields
+
+            # Merge the updates into just the sections they touch, keeping
+            # only sections whose values actually differ.
+            changed: Dict[str, Any] = {}
+            for name, value in kwargs.items():
+                if name not in fields:
+                    continue
+                section = getattr(current, name)
+                if isinstance(section, BaseModel) and isinstance(value, dict):
+                    before = section.model_dump()
+                    merged = copy.deepcopy(before)
+                    self._deep_merge(merged, value)
+                    if merged == before:
+                        continue
+                    value = merged
+                elif value == section:
+                    continue
+                changed[name] = value
+
+            # A form re-submitting identical values shouldn't cost a
+            # validate + encrypt + fsync round trip.
+            if not changed:
+                logger.debug("update_settings: no changes, skipping save")
+                return True
+
+            # Validate only the changed sections (field validators included);
+            # untouched sections are already-validated instances and are
+            # carried over without a second validation pass.
+            validated = AppSettings.model_validate(changed)
+            new_settings = AppSettings.from_trusted_dict(
+                {
+                    name: getattr(validated if name in changed else current, name)
+                    for name in fields
+                },
+                bypass_validators=True,
+            )
             
             # Save and update
             if self.save_settings(new_settings):
@@ -346,12 +519,14 @@ class ConfigManager:
             True if exported successfully, False otherwise
         """
         try:
-            config_dict = self.settings.dict()
-            config_dict = self._remove_sensitive_data(config_dict)
-            config_dict = self._clean_none_values(config_dict)
+            config_dict = self.settings.model_dump(mode="python", exclude_none=True)
+            self._scrub_sensitive_data(config_dict)
             
-            with open(export_path, "w", encoding="utf-8") as f:
-                tomlkit.dump(config_dict, f)
+            import tomli_w
+
+            _atomic_write_bytes(
+                Path(export_path), tomli_w.dumps(config_dict).encode("utf-8")
+            )
             
             logger.info(f"Configuration exported to {export_path}")
             return True
@@ -361,16 +536,12 @@ class ConfigManager:
             return False
 
 
-# Global configuration manager instance
-_config_manager: Optional[ConfigManager] = None
-
-
+# Global configuration manager instance. `get_config_manager.cache_clear()`
+# drops it (e.g. to point a test at a fresh config dir).
+@functools.cache
 def get_config_manager() -> ConfigManager:
     """Get global configuration manager instance."""
-    global _config_manager
-    if _config_manager is None:
-        _config_manager = ConfigManager()
-    return _config_manager
+    return ConfigManager()
 
 
 def get_settings() -> AppSettings:
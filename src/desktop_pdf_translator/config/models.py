@@ -6,7 +6,7 @@ from enum import Enum
 from pathlib import Path
 from typing import Optional, Literal
 
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, validator
 
 class LanguageCode(str, Enum):
     """Supported language codes with Vietnamese priority."""
@@ -26,7 +26,21 @@ class TranslationService(str, Enum):
     ANTHROPIC = "anthropic"
     ARGOS = "argos"
 
-class OpenAISettings(BaseModel):
+class _FrozenSettings(BaseModel):
+    """Base for settings models: immutable once validated.
+
+    ConfigManager builds a new instance for every update, so a settings
+    object can be shared freely across threads and requests.
+
+    `revalidate_instances="never"` (pinned explicitly; it's pydantic v2's
+    default) lets an already-validated section passed into a parent be
+    reused as-is instead of re-validated — safe because it's frozen.
+    """
+
+    model_config = ConfigDict(frozen=True, revalidate_instances="never")
+
+
+class OpenAISettings(_FrozenSettings):
     """OpenAI translation service settings."""
     
     api_key: Optional[str] = Field(None, description="OpenAI API key")
@@ -36,7 +50,7 @@ class OpenAISettings(BaseModel):
     max_tokens: Optional[int] = Field(None, description="Maximum tokens per request")
 
 
-class GeminiSettings(BaseModel):
+class GeminiSettings(_FrozenSettings):
     """Google Gemini translation service settings."""
     
     api_key: Optional[str] = Field(None, description="Google AI API key")
@@ -44,7 +58,7 @@ class GeminiSettings(BaseModel):
     temperature: float = Field(0.3, ge=0.0, le=1.0, description="Translation creativity")
 
 
-class AnthropicSettings(BaseModel):
+class AnthropicSettings(_FrozenSettings):
     """Anthropic (Claude) translation service settings."""
 
     api_key: Optional[str] = Field(None, description="Anthropic API key")
@@ -54,7 +68,7 @@ class AnthropicSettings(BaseModel):
     max_tokens: int = Field(4000, ge=1, description="Maximum tokens per request")
 
 
-class ArgosSettings(BaseModel):
+class ArgosSettings(_FrozenSettings):
     """Argos Translate (offline NMT) settings.
 
     Argos has no API key and a single fixed "model" identifier. Kept here so the
@@ -64,7 +78,7 @@ class ArgosSettings(BaseModel):
     model: str = Field("argostranslate", description="Argos identifier (fixed)")
 
 
-class TranslationSettings(BaseModel):
+class TranslationSettings(_FrozenSettings):
     """Translation-specific settings."""
     
     default_source_lang: LanguageCode = Field(
@@ -95,7 +109,7 @@ class TranslationSettings(BaseModel):
     preserve_formatting: bool = Field(True, description="Preserve PDF formatting")
     min_text_length: int = Field(5, ge=0, description="Minimum text length to translate")
 
-class GUISettings(BaseModel):
+class GUISettings(_FrozenSettings):
     """GUI-specific settings."""
     
     window_width: int = Field(1200, ge=800, description="Default window width")
@@ -105,7 +119,7 @@ class GUISettings(BaseModel):
     auto_preview: bool = Field(True, description="Auto-preview translations")
     vietnamese_font_priority: bool = Field(True, description="Prioritize Vietnamese fonts")
 
-class ProcessingSettings(BaseModel):
+class ProcessingSettings(_FrozenSettings):
     """PDF processing settings."""
 
     max_workers: int = Field(4, ge=1, le=8, description="Maximum parallel workers")
@@ -117,14 +131,14 @@ class ProcessingSettings(BaseModel):
     quality_check: bool = Field(True, description="Enable translation quality checks")
     backup_originals: bool = Field(True, description="Keep backup of original files")
 
-class RAGSettings(BaseModel):
+class RAGSettings(_FrozenSettings):
     """RAG (Retrieval-Augmented Generation) settings."""
 
     enabled: bool = Field(False, description="Enable RAG functionality")
     auto_process_documents: bool = Field(True, description="Auto-process documents for RAG")
 
 
-class AppSettings(BaseModel):
+class AppSettings(_FrozenSettings):
     """Main application settings model."""
     
     # Service configurations
@@ -143,11 +157,40 @@ class AppSettings(BaseModel):
     version: str = Field("1.0.0", description="Application version")
     debug_mode: bool = Field(False, description="Enable debug logging")
     
+    @classmethod
+    def from_trusted_dict(
+        cls, data: dict, bypass_validators: bool = False
+    ) -> "AppSettings":
+        """Build settings from a dict of section values.
+
+        By default this is plain `model_validate`. With
+        `bypass_validators=True` the data is trusted as already valid and
+        typed (e.g. sections taken from existing AppSettings instances) and
+        every model is assembled with `model_construct` — no validation at
+        all. Never bypass for data from the user, disk or env.
+        """
+        if not bypass_validators:
+            return cls.model_validate(data)
+        values = {}
+        for name, field in cls.model_fields.items():
+            if name not in data:
+                continue
+            value = data[name]
+            section_cls = field.annotation
+            if (
+                isinstance(value, dict)
+                and isinstance(section_cls, type)
+                and issubclass(section_cls, BaseModel)
+            ):
+                value = section_cls.model_construct(**value)
+            values[name] = value
+        return cls.model_construct(**values)
+
     @validator('translation')
     def validate_translation_settings(cls, v):
         """Validate translation settings for Vietnamese priority."""
         if v.default_target_lang == LanguageCode.AUTO:
-            v.default_target_lang = LanguageCode.VIETNAMESE
+            return v.model_copy(update={"default_target_lang": LanguageCode.VIETNAMESE})
         return v
     
     def get_active_service_config(self) -> dict:
@@ -155,37 +198,36 @@ class AppSettings(BaseModel):
         if self.translation.preferred_service == TranslationService.OPENAI:
             return {
                 "service": "openai",
-                "config": self.openai.dict()
+                "config": self.openai.model_dump()
             }
         elif self.translation.preferred_service == TranslationService.GEMINI:
             return {
                 "service": "gemini",
-                "config": self.gemini.dict()
+                "config": self.gemini.model_dump()
             }
         elif self.translation.preferred_service == TranslationService.ANTHROPIC:
             return {
                 "service": "anthropic",
-                "config": self.anthropic.dict()
+                "config": self.anthropic.model_dump()
             }
         elif self.translation.preferred_service == TranslationService.ARGOS:
             return {
                 "service": "argos",
-                "config": self.argos.dict()
+                "config": self.argos.model_dump()
             }
         else:
             raise ValueError(f"Unsupported service: {self.translation.preferred_service}")
 
     def validate_service_credentials(self) -> tuple[bool, str]:
         """Validate that required service credentials are available."""
-        active_service = self.get_active_service_config()
-        service_name = active_service["service"]
-        config = active_service["config"]
-
-        if service_name == "argos":
+        service = self.translation.preferred_service
+        if service == TranslationService.ARGOS:
             return True, "Argos is offline; no credentials required"
 
-        if not config.get("api_key"):
-            return False, f"Missing API key for {service_name}"
+        # Only the key matters here — read it straight off the section
+        # instead of dumping the whole active-service config.
+        if not self.has_api_key(service):
+            return False, f"Missing API key for {service.value}"
 
         return True, "Credentials validated"
 
@@ -196,12 +238,7 @@ class AppSettings(BaseModel):
         """
         if service == TranslationService.ARGOS:
             return True
-        per_service = {
-            TranslationService.OPENAI: self.openai.api_key,
-            TranslationService.GEMINI: self.gemini.api_key,
-            TranslationService.ANTHROPIC: self.anthropic.api_key,
-        }
-        return bool(per_service.get(service))
+        return bool(getattr(getattr(self, service.value, None), "api_key", None))
 
 class FileMetadata(BaseModel):
     """Metadata for processed PDF files."""
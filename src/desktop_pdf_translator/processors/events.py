@@ -24,7 +24,7 @@ class EventType(str, Enum):
     PARAGRAPH_TRANSLATED = "paragraph_translated"
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessingEvent:
     """Base class for all processing events."""
     
@@ -43,7 +43,7 @@ class ProcessingEvent:
         }
 
 
-@dataclass 
+@dataclass(slots=True)
 class ProgressEvent(ProcessingEvent):
     """Progress update event."""
     
@@ -64,7 +64,7 @@ class ProgressEvent(ProcessingEvent):
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ErrorEvent(ProcessingEvent):
     """Error event."""
     
@@ -83,7 +83,7 @@ class ErrorEvent(ProcessingEvent):
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ChunkReadyEvent(ProcessingEvent):
     """A chunk of the source PDF has finished translating; the rolling
     merged PDF on disk now contains pages 1..pages_in_chunk[1]."""
@@ -119,7 +119,7 @@ class ChunkReadyEvent(ProcessingEvent):
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ParagraphTranslatedEvent(ProcessingEvent):
     """A single paragraph just finished translating. Frontend uses this to
     show a 'live ticker' of EN → VI preview text in the progress overlay.
@@ -141,7 +141,7 @@ class ParagraphTranslatedEvent(ProcessingEvent):
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class CompletionEvent(ProcessingEvent):
     """Processing completion event."""
     
@@ -14,10 +14,7 @@ from typing import AsyncGenerator, Optional
 
 import fitz  # PyMuPDF
 
-from babeldoc.format.pdf.high_level import async_translate as babeldoc_translate
-from babeldoc.format.pdf.translation_config import TranslationConfig as BabelDOCConfig
-from babeldoc.format.pdf.translation_config import WatermarkOutputMode as BabelDOCWatermarkMode
-
+from .._lazy import lazy_import
 from ..config import get_settings, FileMetadata, LanguageCode, TranslationService
 from ..translators import TranslatorFactory
 from ..translators.argos_translator import ArgosTranslator
@@ -33,6 +30,21 @@ from .events import (
 from .pdf_cache import compute_file_hash, get_pdf_cache
 from .exceptions import ProcessingError, BabelDOCError, FileValidationError, ConfigurationError
 
+# BabelDOC pulls in its layout/typesetting stack at import time, which costs
+# seconds. Only the translate path needs it, so it's loaded on first use
+# rather than while the sidecar boots (collect_submodules("babeldoc") in the
+# spec keeps it bundled).
+_babeldoc_high_level = lazy_import("babeldoc.format.pdf.high_level")
+_babeldoc_translation_config = lazy_import("babeldoc.format.pdf.translation_config")
+
+
+def _load_babeldoc() -> None:
+    """Blocking: resolve the lazy BabelDOC modules. Run it in a worker thread
+    (the sidecar lifespan pre-warms it, and the translate path awaits it via
+    `asyncio.to_thread`) so the multi-second import never runs on the loop."""
+    _babeldoc_high_level.async_translate
+    _babeldoc_translation_config.TranslationConfig
+
 
 # Background PDF-cache store tasks. The processor schedules store() off the
 # critical path so the SSE `done` event isn't held up by the SHA-256 + copy +
@@ -462,7 +474,10 @@ class PDFProcessor:
             self._paragraphs_seen = 0
             self._service_name = translation_service.value
 
-            translator = TranslatorFactory.create_translator(
+            # Construction imports the provider SDK and builds its client —
+            # keep that off the event loop.
+            translator = await asyncio.to_thread(
+                TranslatorFactory.create_translator,
                 service=translation_service,
                 lang_in=source_lang,
                 lang_out=target_lang,
@@ -487,7 +502,10 @@ class PDFProcessor:
             self._priority_anchor = max(0, visible_page - 1)
             self._priority_lock = asyncio.Lock()
 
-            # Step 3: BabelDOC processing
+            # Step 3: BabelDOC processing. Normally already imported by the
+            # startup pre-warm; if the first translation beats it, wait in a
+            # worker thread rather than importing on the event loop.
+            await asyncio.to_thread(_load_babeldoc)
             logger.info(
                 "Using BabelDOC processing (priority anchor = page %d)",
                 visible_page,
@@ -667,7 +685,9 @@ class PDFProcessor:
                     f"Too many pages: {page_count} > {self.settings.translation.max_pages}"
                 )
             
-            return FileMetadata(
+            # Every value here was computed above from the file itself, so
+            # skip pydantic validation.
+            return FileMetadata.model_construct(
                 original_path=file_path,
                 filename=file_path.name,
                 file_size_mb=file_size_mb,
@@ -690,7 +710,7 @@ class PDFProcessor:
         """Process PDF using BabelDOC with 1-page chunks running in a parallel
         render pipeline.
 
-        BabelDOC's pipeline is monolithic — every call to `babeldoc_translate()`
+        BabelDOC's pipeline is monolithic — every call to `async_translate()`
         runs all 13 stages (layout → translate → typeset → render → save) and
         there is no external hook to peel "translate" apart from "render". So
         we get streaming + pipelining by structuring it at the orchestration
@@ -792,7 +812,7 @@ class PDFProcessor:
                         "Chunk %d/%d (page %d): BabelDOC pipeline start",
                         idx + 1, total_chunks, page_range[0],
                     )
-                    async for event in babeldoc_translate(config):
+                    async for event in _babeldoc_high_level.async_translate(config):
                         etype = event["type"]
                         if etype == "error":
                             raise BabelDOCError(
@@ -1142,7 +1162,7 @@ class PDFProcessor:
         is_argos = isinstance(translator, ArgosTranslator)
 
         # Configure for single translated PDF output only (no dual, no decompressed, no bounding boxes)
-        config = BabelDOCConfig(
+        config = _babeldoc_translation_config.TranslationConfig(
             translator=translator,
             input_file=file_path,
             lang_in=translator.lang_in,
@@ -1172,7 +1192,7 @@ class PDFProcessor:
             enhance_compatibility=not is_argos,
             use_alternating_pages_dual=False,
             # Set watermark mode to NoWatermark to avoid bounding boxes
-            watermark_output_mode=BabelDOCWatermarkMode.NoWatermark if BabelDOCWatermarkMode else None,
+            watermark_output_mode=_babeldoc_translation_config.WatermarkOutputMode.NoWatermark,
             min_text_length=translation_settings.min_text_length,
             report_interval=0.1,
             skip_clean=True,
@@ -8,12 +8,20 @@ Features:
 - Multi-modal embeddings (text, equations, tables, figures)
 - Reference system with page navigation
 - Vietnamese language optimization
+
+Exports are resolved lazily so importing one submodule (e.g. `rag.rag_chain`
+for a question) doesn't drag in the others' dependencies — camelot and
+pdfplumber are only needed when indexing.
 """
 
-from .document_processor import ScientificPDFProcessor
-from .vector_store import ChromaDBManager
-from .rag_chain import EnhancedRAGChain
-from .reference_manager import ReferenceManager
+from .._lazy import lazy_exports
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    'ScientificPDFProcessor': 'document_processor',
+    'ChromaDBManager': 'vector_store',
+    'EnhancedRAGChain': 'rag_chain',
+    'ReferenceManager': 'reference_manager',
+})
 
 __all__ = [
     'ScientificPDFProcessor',
@@ -12,7 +12,7 @@ from dataclasses import dataclass
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class PDFReference:
     """Reference to a specific location in a PDF document."""
     
@@ -31,7 +31,7 @@ class PDFReference:
         return f"Trang {self.page}: {self.text[:100]}..."
 
 
-@dataclass
+@dataclass(slots=True)
 class WebReference:
     """Reference to a web source."""
     
@@ -10,8 +10,6 @@ placeholders), so this class plugs in the same way OpenAITranslator/GeminiTransl
 import logging
 from typing import List, Dict
 
-import anthropic
-
 from .base import BaseTranslator, LANGUAGE_DISPLAY_NAMES
 from .translation_cache import llm_cache_get as _llm_cache_get, llm_cache_set as _llm_cache_set
 
@@ -40,6 +38,8 @@ class AnthropicTranslator(BaseTranslator):
         self.max_tokens = kwargs.get("max_tokens", 4000)
         self.base_url = kwargs.get("base_url")
 
+        import anthropic
+
         client_kwargs = {"api_key": self.api_key}
         if self.base_url:
             client_kwargs["base_url"] = self.base_url
@@ -22,6 +22,13 @@ LANGUAGE_DISPLAY_NAMES: Dict[str, str] = {
     "auto": "automatically detected language",
 }
 
+# Vietnamese punctuation clean-up, run on every translated paragraph — compiled
+# once here instead of going through re's pattern cache on each call.
+_SPACE_BEFORE_PUNCT_RE = re.compile(r'\s+([.,;:!?])')
+_CLAUSE_PUNCT_BEFORE_LETTER_RE = re.compile(r'([,;:])(?=[^\W\d_])')
+_SENTENCE_END_BEFORE_UPPER_RE = re.compile(r'([.!?])(?=[A-Z])')
+_MULTI_SPACE_RE = re.compile(r' {2,}')
+
 
 class BaseTranslator(ABC):
     """
@@ -183,15 +190,15 @@ class BaseTranslator(ABC):
         text = text.strip()
 
         if self.lang_out == "vi":
-            text = re.sub(r'\s+([.,;:!?])', r'\1', text)
+            text = _SPACE_BEFORE_PUNCT_RE.sub(r'\1', text)
             # Insert a space after punctuation only at genuine word boundaries.
             # `,;:` → only when followed by a letter, so `1,000`, `12:30`,
             # and `http://` stay intact. Sentence enders `.!?` → only before
             # an uppercase letter (sentence boundary), so `3.14`,
             # `example.com`, and `?a=1` query strings stay intact.
-            text = re.sub(r'([,;:])(?=[^\W\d_])', r'\1 ', text)
-            text = re.sub(r'([.!?])(?=[A-Z])', r'\1 ', text)
-            text = re.sub(r' {2,}', ' ', text)
+            text = _CLAUSE_PUNCT_BEFORE_LETTER_RE.sub(r'\1 ', text)
+            text = _SENTENCE_END_BEFORE_UPPER_RE.sub(r'\1 ', text)
+            text = _MULTI_SPACE_RE.sub(' ', text)
 
         return text
     
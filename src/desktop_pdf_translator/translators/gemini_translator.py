@@ -5,9 +5,6 @@ Google Gemini translator implementation with Vietnamese optimization.
 import logging
 from typing import Optional, List, Dict, Any
 
-from google import genai
-from google.genai import types as genai_types
-
 from .base import BaseTranslator, LANGUAGE_DISPLAY_NAMES
 from .translation_cache import llm_cache_get as _llm_cache_get, llm_cache_set as _llm_cache_set
 
@@ -34,6 +31,9 @@ class GeminiTranslator(BaseTranslator):
         self.model_name = kwargs.get("model", "gemini-pro")
         self.temperature = kwargs.get("temperature", 0.3)
 
+        from google import genai
+        from google.genai import types as genai_types
+
         self.client = genai.Client(api_key=self.api_key)
         self.generation_config = genai_types.GenerateContentConfig(
             temperature=self.temperature,
@@ -89,6 +89,8 @@ class GeminiTranslator(BaseTranslator):
         max_tokens: int = 1000,
     ) -> Optional[str]:
         """Freeform generation used by the RAG chain."""
+        from google.genai import types as genai_types
+
         try:
             config = genai_types.GenerateContentConfig(
                 temperature=0.3,
@@ -156,6 +158,8 @@ Provide only the translation:"""
 
     def validate_configuration(self) -> tuple[bool, str]:
         """Validate Gemini configuration."""
+        from google.genai import types as genai_types
+
         try:
             if not self.api_key:
                 return False, "API key is missing"
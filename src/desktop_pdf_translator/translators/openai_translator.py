@@ -5,8 +5,6 @@ OpenAI translator implementation with Vietnamese optimization.
 import logging
 from typing import Optional, List, Dict, Any
 
-from openai import OpenAI
-
 from .base import BaseTranslator, LANGUAGE_DISPLAY_NAMES
 from .translation_cache import llm_cache_get as _llm_cache_get, llm_cache_set as _llm_cache_set
 
@@ -35,6 +33,8 @@ class OpenAITranslator(BaseTranslator):
         self.max_tokens = kwargs.get("max_tokens", 4000)
         self.base_url = kwargs.get("base_url")
 
+        from openai import OpenAI
+
         self.client = OpenAI(api_key=self.api_key, base_url=self.base_url)
 
         logger.info(f"OpenAI translator configured with model: {self.model}")
@@ -1,5 +1,6 @@
 import os
 import base64
+import functools
 import hashlib
 import platform
 from typing import Optional
@@ -8,6 +9,10 @@ from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.kdf.hkdf import HKDF
 
 
+# The machine id can't change while we're running, and the derived key is a
+# pure function of it and the salt — cache both so repeated encrypt/decrypt
+# calls skip the registry read and the HKDF.
+@functools.lru_cache(maxsize=1)
 def _get_machine_id() -> str:
     system = platform.system()
     
@@ -25,6 +30,7 @@ def _get_machine_id() -> str:
     return platform.node() + platform.machine()
 
 
+@functools.lru_cache(maxsize=8)
 def _derive_key_from_machine(salt: bytes) -> bytes:
     machine_id = _get_machine_id()
     